@@ -1,10 +1,17 @@
 """Dash dashboard for PR visualisations."""
 
-from pathlib import Path
+import ast
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from dash import Dash, Input, Output, callback, dcc, html
+from dash import ClientsideFunction, Dash, Input, Output, State, callback, clientside_callback, dcc, html
+from dash.exceptions import PreventUpdate
+from numba import njit
+from plotly.colors import qualitative
+
+from setup_data import PARQUET_PATH, USECOLS, convert_csv_to_parquet, parquet_is_stale
 
 # User aliases dictionary - map user.login to display names
 user_aliases = {
@@ -33,9 +40,10 @@ user_aliases = {
     'henryspeir': 'Henry',
 }
 
-# Load data
-data_dir = Path("data")
-df_all_prs = pd.read_csv(data_dir / "all_prs_detailed_qgis.csv")
+# Load data - regenerate the Parquet copy when the CSV is newer, then read only the columns used
+if parquet_is_stale():
+    convert_csv_to_parquet()
+df_all_prs = pd.read_parquet(PARQUET_PATH, columns=USECOLS)
 
 # Remove copilot entries
 df_all_prs = df_all_prs[df_all_prs['user.login'] != 'dp-actions[bot]'].copy()
@@ -43,20 +51,23 @@ df_all_prs = df_all_prs[df_all_prs['user.login'] != 'dp-actions[bot]'].copy()
 # Remove rows with additions>30_000 (I suspect these are errors)
 df_all_prs = df_all_prs[df_all_prs['additions'] <= 30000].copy()
 
-# Create 'source' column based on base.repo.name
-def assign_source(repo_name):
-    if repo_name == 'mapper-project-template':
-        return 'mapper_template'
-    elif repo_name == 'space-intelligence':
-        return 'space_intelligence'
-    else:
-        return 'qgis_plugins'
+# Create 'source' column based on base.repo.name (any other repo is a QGIS plugin)
+source_by_repo = {
+    'mapper-project-template': 'mapper_template',
+    'space-intelligence': 'space_intelligence',
+}
+SOURCES = ['mapper_template', 'space_intelligence', 'qgis_plugins']
+df_all_prs['source'] = pd.Categorical(
+    df_all_prs['base.repo.name'].map(source_by_repo).fillna('qgis_plugins'),
+    categories=SOURCES
+)
 
-df_all_prs['source'] = df_all_prs['base.repo.name'].apply(assign_source)
+WEIGHT_METRICS = ['pr_count', 'lines_added', 'net_lines', 'comments']
 
 
+@lru_cache(maxsize=None)
 def get_plot_title_prefix(dataset_selection):
-    """Generate plot title prefix from selected datasets."""
+    """Generate plot title prefix from selected datasets (a tuple, so results can be cached)."""
     if not dataset_selection or len(dataset_selection) == 0:
         return 'No Data'
     
@@ -77,6 +88,7 @@ def get_plot_title_prefix(dataset_selection):
         return f'{" + ".join(display_names)} PRs'
 
 
+@lru_cache(maxsize=None)
 def get_weight_label(weight_by):
     """Get the display label for the weight metric."""
     labels = {
@@ -102,665 +114,512 @@ def calculate_weight(df, weight_by):
         return 1
 
 
-def plot_cumulative_prs(dataset_selection, weight_by='pr_count'):
-    """Create an animated plot showing cumulative PRs throughout the year."""
-    # Select dataset - dataset_selection is now a list
-    if not dataset_selection or len(dataset_selection) == 0:
-        return go.Figure()
-    
-    # Filter data based on selected sources
-    df = df_all_prs[df_all_prs['source'].isin(dataset_selection)].copy()
-    plot_title_prefix = get_plot_title_prefix(dataset_selection)
+def weight_column(weight_by):
+    """Get the name of the precomputed weight column for the weight metric."""
+    if weight_by not in WEIGHT_METRICS:
+        weight_by = 'pr_count'
+    return f'weight_{weight_by}'
 
-    # Preprocess data
-    df['merged_at'] = pd.to_datetime(df['merged_at'])
-    df_merged = df[df['merged_at'].notna()].copy()
-    df_merged['year'] = df_merged['merged_at'].dt.year
-    df_merged['day_of_year'] = df_merged['merged_at'].dt.dayofyear
-    df_merged['date'] = df_merged['merged_at'].dt.date
-    
-    # Add weight column
-    df_merged['weight'] = calculate_weight(df_merged, weight_by)
 
-    # Calculate cumulative data
-    cumulative_data = []
-    available_years = sorted(df_merged['year'].unique())
+# Cache the weight of every PR for each metric, in the smallest integer type that fits
+for _weight_by in WEIGHT_METRICS:
+    _weight_col = weight_column(_weight_by)
+    df_all_prs[_weight_col] = calculate_weight(df_all_prs, _weight_by)
+    df_all_prs[_weight_col] = pd.to_numeric(df_all_prs[_weight_col].astype('int64'), downcast='integer')
+
+
+# Preprocess merged PRs once at load time, with compact int16 year and day columns
+df_merged = df_all_prs[df_all_prs['merged_at'].notna()].copy()
+df_merged['year'] = df_merged['merged_at'].dt.year.astype('int16')
+df_merged['day_of_year'] = df_merged['merged_at'].dt.dayofyear.astype('int16')
+
 
-    for year in available_years:
-        year_df = df_merged[df_merged['year'] == year].copy()
-        year_df = year_df.sort_values('merged_at')
+def display_names(logins):
+    """Map logins to display names once per category, merging logins that share a name, in alphabetical order."""
+    display = logins.astype('category').map(lambda login: user_aliases.get(login, login))
+    # Build a new Categorical - astype ignores the category order of an unordered dtype
+    return pd.Categorical(display, categories=sorted(display.unique()))
 
-        if len(year_df) == 0:
-            continue
 
-        max_day = year_df['day_of_year'].max()
-        for day in range(1, max_day + 1):
-            cumulative_count = year_df[year_df['day_of_year'] <= day]['weight'].sum()
-            cumulative_data.append({
-                'day_of_year': day,
-                'cumulative_prs': cumulative_count,
-                'year': str(year)
-            })
+df_merged['user_display'] = display_names(df_merged['user.login'])
 
-    df_cumulative = pd.DataFrame(cumulative_data)
 
-    if len(df_cumulative) == 0:
+def parse_reviewer_logins(reviewers_str):
+    """Parse the reviewer logins from a requested_reviewers string."""
+    try:
+        reviewers_list = ast.literal_eval(reviewers_str)
+    except (ValueError, SyntaxError):
+        return []
+    if not isinstance(reviewers_list, list):
+        return []
+    return [reviewer['login'] for reviewer in reviewers_list if isinstance(reviewer, dict) and 'login' in reviewer]
+
+
+# Parse each distinct requested_reviewers string once and expand to one row per review
+parsed_reviewers = {
+    reviewers_str: parse_reviewer_logins(reviewers_str)
+    for reviewers_str in df_merged['requested_reviewers'].dropna().unique()
+    if reviewers_str != '[]'
+}
+df_reviews = (
+    df_merged[['merged_at', 'source', 'year', 'day_of_year']]
+    .assign(reviewer_login=df_merged['requested_reviewers'].map(parsed_reviewers), weight=np.int8(1))
+    .explode('reviewer_login')
+    .dropna(subset=['reviewer_login'])
+)
+df_reviews['user_display'] = display_names(df_reviews['reviewer_login'])
+
+# Assign each user a fixed colour so it stays the same across selections and plots
+USER_PALETTE = qualitative.Plotly + qualitative.Set2 + qualitative.Pastel
+USER_COLORS = {
+    user: USER_PALETTE[i % len(USER_PALETTE)]
+    for i, user in enumerate(sorted(
+        set(df_merged['user_display'].cat.categories) | set(df_reviews['user_display'].cat.categories)
+    ))
+}
+
+YEARS = sorted(df_merged['year'].unique())
+DAYS = np.arange(1, 367)
+# Upper bound on animation frames per plot, the frame days are spaced evenly up to it
+MAX_FRAMES = 60
+
+
+def source_mask(df, dataset_selection):
+    """Get a mask of the rows from the selected sources, comparing categorical codes."""
+    codes = df['source'].cat.categories.get_indexer(dataset_selection)
+    return df['source'].cat.codes.isin(codes)
+
+
+def split_by_year(df):
+    """Split the rows into one frame per year, so a plot only scans the rows of its year."""
+    return {year: rows for year, rows in df.groupby('year', sort=False)}
+
+
+MERGED_BY_YEAR = split_by_year(df_merged)
+REVIEWS_BY_YEAR = split_by_year(df_reviews)
+
+
+def select_year(by_year, dataset_selection, year):
+    """Get the rows of the selected sources in a year (None for a year without data) and the title prefix without ' PRs'."""
+    plot_title_prefix = get_plot_title_prefix(dataset_selection).replace(' PRs', '')
+    if year not in by_year:
+        return None, plot_title_prefix
+    # No copy - the plots only read the selected rows
+    df_year = by_year[year]
+    return df_year[source_mask(df_year, dataset_selection)], plot_title_prefix
+
+
+@njit(cache=True)
+def build_cum(day, group, weight, n_groups, n_days):
+    """Sum weights into a (group x day) matrix, column 0 unused, and accumulate along the days."""
+    out = np.zeros((n_groups, n_days + 1), np.int64)
+    for i in range(day.size):
+        out[group[i], day[i]] += weight[i]
+    for g in range(n_groups):
+        for d in range(1, n_days + 1):
+            out[g, d] += out[g, d - 1]
+    return out
+
+
+def cumulative_matrix(df, group_col, weight_col):
+    """Get the groups, their (group x day of year) cumulative weights and the last day each group was active."""
+    codes, groups = pd.factorize(df[group_col], sort=True)
+    days = df['day_of_year'].to_numpy()
+    cumulative = build_cum(days, codes, df[weight_col].to_numpy(), len(groups), len(DAYS))
+    last_day = np.zeros(len(groups), dtype=np.int64)
+    np.maximum.at(last_day, codes, days)
+    return np.asarray(groups), cumulative[:, 1:], last_day
+
+
+def frame_days(cumulative, max_day):
+    """Get about MAX_FRAMES evenly spaced frame days up to max_day, skipping days where no curve changed."""
+    step = -(-max_day // MAX_FRAMES)
+    days = np.union1d(np.arange(1, max_day + 1, step), [max_day])
+    values = cumulative[:, days - 1]
+    changed = np.ones(len(days), dtype=bool)
+    changed[1:] = (values[:, 1:] != values[:, :-1]).any(axis=0)
+    changed[-1] = True
+    return days[changed]
+
+
+# Last day of each year with a merged PR, per source (0 if there were none)
+LAST_MERGED_DAY = {
+    source: df_merged[df_merged['source'] == source]
+    .groupby('year')['day_of_year'].max()
+    .reindex(YEARS, fill_value=0)
+    .to_numpy()
+    for source in SOURCES
+}
+
+# Cumulative (year x day) tables per weight metric and source
+PRECOMPUTED = {}
+for _weight_by in WEIGHT_METRICS:
+    _cumulative = (
+        df_merged.groupby(['source', 'year', 'day_of_year'], observed=True)[weight_column(_weight_by)].sum()
+        .unstack(fill_value=0)
+        .reindex(index=pd.MultiIndex.from_product([SOURCES, YEARS]), columns=DAYS, fill_value=0)
+        .cumsum(axis=1)
+    )
+    PRECOMPUTED[_weight_by] = {source: _cumulative.loc[source].to_numpy() for source in SOURCES}
+
+
+# Initialize the Dash app
+external_stylesheets = ['https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap']
+app = Dash(__name__, external_stylesheets=external_stylesheets)
+# WSGI entry point for Gunicorn (see Procfile)
+server = app.server
+
+# Static layout shared by every animated plot; each plot only patches title, y axis and sliders
+_FONT = {'family': 'Space Grotesk', 'size': 14}
+
+_XAXIS = {
+    'title': {'text': 'Month'},
+    'range': [0, 366],
+    'tickmode': 'array',
+    'tickvals': [1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 365],
+    'ticktext': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Dec'],
+    'showgrid': True,
+    'gridcolor': '#f0f0f0',
+    'showline': True,
+    'linecolor': '#e0e0e0',
+    'linewidth': 1
+}
+
+_BASE_LAYOUT = {
+    'height': 600,
+    'showlegend': True,
+    'font': _FONT,
+    'plot_bgcolor': 'white',
+    'paper_bgcolor': 'white',
+    'xaxis': _XAXIS
+}
+
+_YAXIS_TEMPLATE = {
+    'showgrid': True,
+    'gridcolor': '#f0f0f0',
+    'showline': True,
+    'linecolor': '#e0e0e0',
+    'linewidth': 1
+}
+
+_SLIDER_TEMPLATE = {
+    'x': 0.1,
+    'len': 0.9,
+    'xanchor': 'left',
+    'y': 0,
+    'yanchor': 'top'
+}
+
+
+@lru_cache(maxsize=None)
+def animation_updatemenus(frame_duration):
+    """Return the Play/Pause buttons for a given frame duration in milliseconds."""
+    return [{
+        'type': 'buttons',
+        'showactive': False,
+        'buttons': [
+            {'label': 'Play', 'method': 'animate', 'args': [None, {
+                'frame': {'duration': frame_duration, 'redraw': True},
+                'fromcurrent': True,
+                'mode': 'immediate'
+            }]},
+            {'label': 'Pause', 'method': 'animate', 'args': [[None], {
+                'frame': {'duration': 0, 'redraw': False},
+                'mode': 'immediate'
+            }]}
+        ]
+    }]
+
+
+@lru_cache(maxsize=None)
+def slider_step(day):
+    """Return the slider step that jumps to the frame of a day."""
+    return {
+        'args': [[str(day)], {'frame': {'duration': 0, 'redraw': True}, 'mode': 'immediate'}],
+        'label': f'Day {day}',
+        'method': 'animate'
+    }
+
+
+def animation_sliders(days):
+    """Return the slider over every other frame day, set to the last day as the figure starts with the full curves."""
+    steps = [slider_step(int(day)) for day in days[::-2][::-1]]
+    return [{**_SLIDER_TEMPLATE, 'steps': steps, 'active': len(steps) - 1}]
+
+
+def plot_cumulative_prs(dataset_selection, weight_by='pr_count'):
+    """Create an animated plot showing cumulative PRs throughout the year."""
+    # Select dataset - dataset_selection is a tuple so results can be memoized
+    if not dataset_selection or len(dataset_selection) == 0:
         return go.Figure()
 
-    # Create figure with animation
-    fig = go.Figure()
+    plot_title_prefix = get_plot_title_prefix(dataset_selection)
+
+    # Combine the precomputed cumulative tables of the selected sources
+    precomputed = PRECOMPUTED.get(weight_by, PRECOMPUTED['pr_count'])
+    cumulative = np.add.reduce([precomputed[source] for source in dataset_selection])
+    last_day = np.maximum.reduce([LAST_MERGED_DAY[source] for source in dataset_selection])
+
+    # Keep the years with merged PRs
+    has_prs = last_day > 0
+    if not has_prs.any():
+        return go.Figure()
+
+    years = [str(year) for year in np.asarray(YEARS)[has_prs]]
+    cumulative = cumulative[has_prs]
+    last_day = last_day[has_prs]
 
-    # Get unique years
-    years = df_cumulative['year'].unique()
     colors = {'2024': '#C26E75', '2025': '#75303B'}
     default_colors = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA']
+    year_colors = {year: colors.get(year, default_colors[i % len(default_colors)]) for i, year in enumerate(years)}
+    # Styles are shared by the initial traces and every frame
+    styles = {
+        year: {
+            'line': {'color': year_color, 'width': 2},
+            'marker': {'size': 12, 'color': year_color},
+            'textfont': {'color': year_color, 'size': 12, 'family': 'Avenir'}
+        }
+        for year, year_color in year_colors.items()
+    }
 
-    # Add initial traces
+    # Add one line trace per year followed by one marker trace per year, with the full curves
+    # Lines are drawn with WebGL; the few labelled markers stay SVG
+    line_traces = []
+    marker_traces = []
     for i, year in enumerate(years):
-        year_color = colors.get(year, default_colors[i % len(default_colors)])
-        fig.add_trace(go.Scatter(
-            x=[],
-            y=[],
-            mode='lines',
-            name=year,
-            line=dict(color=year_color, width=2),
-            showlegend=True
-        ))
-        fig.add_trace(go.Scatter(
-            x=[],
-            y=[],
-            mode='markers+text',
-            name=year,
-            marker=dict(size=12, color=year_color),
-            text=[],
-            textposition='middle right',
-            textfont=dict(color=year_color, size=12, family='Avenir'),
-            showlegend=False
-        ))
-
-    # Create frames
-    frames = []
-    max_day = int(df_cumulative['day_of_year'].max())
-
-    for day in range(1, max_day + 1, 2):
-        frame_data = []
-        for i, year in enumerate(years):
-            year_color = colors.get(year, default_colors[i % len(default_colors)])
-            year_data = df_cumulative[df_cumulative['year'] == year]
-            max_day_for_year = int(year_data['day_of_year'].max())
-
-            year_data_up_to_day = year_data[year_data['day_of_year'] <= day]
-
-            frame_data.append(go.Scatter(
-                x=year_data_up_to_day['day_of_year'],
-                y=year_data_up_to_day['cumulative_prs'],
-                mode='lines',
-                name=year,
-                line=dict(color=year_color, width=2)
-            ))
-
-            if day <= max_day_for_year:
-                current_point = year_data_up_to_day[year_data_up_to_day['day_of_year'] == day]
-                if len(current_point) == 0:
-                    current_point = year_data_up_to_day.iloc[[-1]] if len(year_data_up_to_day) > 0 else year_data_up_to_day
-            else:
-                current_point = year_data[year_data['day_of_year'] == max_day_for_year]
-
-            if len(current_point) > 0:
-                frame_data.append(go.Scatter(
-                    x=current_point['day_of_year'],
-                    y=current_point['cumulative_prs'],
-                    mode='markers+text',
-                    name=year,
-                    marker=dict(size=12, color=year_color),
-                    text=[year],
-                    textposition='middle right',
-                    textfont=dict(color=year_color, size=12, family='Avenir')
-                ))
-            else:
-                frame_data.append(go.Scatter(x=[], y=[], mode='markers+text', text=[]))
-
-        frames.append(go.Frame(data=frame_data, name=str(day)))
-
-    fig.frames = frames
+        end_day = last_day[i]
+        line_traces.append({
+            'type': 'scattergl',
+            'x': DAYS[:end_day],
+            'y': cumulative[i, :end_day],
+            'mode': 'lines',
+            'name': year,
+            'line': styles[year]['line'],
+            'showlegend': True
+        })
+        marker_traces.append({
+            'type': 'scatter',
+            'x': DAYS[end_day - 1:end_day],
+            'y': cumulative[i, end_day - 1:end_day],
+            'mode': 'markers+text',
+            'name': year,
+            'marker': styles[year]['marker'],
+            'text': [year],
+            'textposition': 'middle right',
+            'textfont': styles[year]['textfont'],
+            'showlegend': False
+        })
+    traces = line_traces + marker_traces
+
+    # Frames are built in the browser from the full curves (assets/animation.js), only their days are sent
+    days = frame_days(cumulative, int(last_day.max()))
 
     weight_label = get_weight_label(weight_by)
-    fig.update_layout(
-        title=f'Cumulative {plot_title_prefix} through the year',
-        xaxis_title='Month',
-        yaxis_title=f'Cumulative {weight_label}',
-        height=600,
-        showlegend=True,
-        font=dict(family='Space Grotesk', size=14),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        xaxis=dict(
-            range=[0, 366],
-            tickmode='array',
-            tickvals=[1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 365],
-            ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Dec'],
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            showline=True,
-            linecolor='#e0e0e0',
-            linewidth=1
-        ),
-        yaxis=dict(
-            range=[0, df_cumulative['cumulative_prs'].max() * 1.1],
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            showline=True,
-            linecolor='#e0e0e0',
-            linewidth=1
-        ),
-        updatemenus=[{
-            'type': 'buttons',
-            'showactive': False,
-            'buttons': [
-                {'label': 'Play', 'method': 'animate', 'args': [None, {
-                    'frame': {'duration': 100, 'redraw': True},
-                    'fromcurrent': True,
-                    'mode': 'immediate'
-                }]},
-                {'label': 'Pause', 'method': 'animate', 'args': [[None], {
-                    'frame': {'duration': 0, 'redraw': False},
-                    'mode': 'immediate'
-                }]}
-            ]
-        }],
-        sliders=[{
-            'steps': [
-                {'args': [[f.name], {'frame': {'duration': 0, 'redraw': True}, 'mode': 'immediate'}],
-                 'label': f'Day {f.name}', 'method': 'animate'}
-                for f in fig.frames[::7]
-            ],
-            'active': 0,
-            'x': 0.1,
-            'len': 0.9,
-            'xanchor': 'left',
-            'y': 0,
-            'yanchor': 'top'
-        }]
-    )
+    layout = {
+        **_BASE_LAYOUT,
+        'title': {'text': f'Cumulative {plot_title_prefix} through the year'},
+        'yaxis': {**_YAXIS_TEMPLATE, 'title': {'text': f'Cumulative {weight_label}'}, 'range': [0, cumulative.max() * 1.1]},
+        'updatemenus': animation_updatemenus(100),
+        # Keep zoom and legend toggles while frames play, reset them when the inputs change
+        'uirevision': str((dataset_selection, weight_by)),
+        'sliders': animation_sliders(days),
+        'meta': {'frame_days': days.tolist()}
+    }
+
+    # Create figure, skipping plotly.py validation of every trace
+    fig = go.Figure(dict(data=traces, layout=layout), _validate=False)
 
     return fig
 
 
 def plot_cumulative_prs_by_user(dataset_selection, year=2025, weight_by='pr_count'):
     """Create an animated plot showing cumulative PRs throughout the year for each user."""
-    # Select dataset - dataset_selection is now a list
+    # Select dataset - dataset_selection is a tuple so results can be memoized
     if not dataset_selection or len(dataset_selection) == 0:
         return go.Figure()
     
-    # Filter data based on selected sources
-    df = df_all_prs[df_all_prs['source'].isin(dataset_selection)].copy()
-    
-    # Get plot title without 'PRs' suffix for user comparison
-    title_parts = get_plot_title_prefix(dataset_selection)
-    # Remove ' PRs' from the end to add it back in the final title
-    plot_title_prefix = title_parts.replace(' PRs', '')
-
-    # Preprocess data
-    df['merged_at'] = pd.to_datetime(df['merged_at'])
-    df_merged = df[df['merged_at'].notna()].copy()
-    df_merged['year'] = df_merged['merged_at'].dt.year
-    df_merged['day_of_year'] = df_merged['merged_at'].dt.dayofyear
-    df_merged['date'] = df_merged['merged_at'].dt.date
-
-    # Filter for specified year
-    df_year = df_merged[df_merged['year'] == year].copy()
-
-    if len(df_year) == 0:
-        return go.Figure()
+    df_year, plot_title_prefix = select_year(MERGED_BY_YEAR, dataset_selection, year)
 
-    # Apply user aliases
-    df_year['user_display'] = df_year['user.login'].map(user_aliases).fillna(df_year['user.login'])
-    
-    # Add weight column
-    df_year['weight'] = calculate_weight(df_year, weight_by)
+    if df_year is None or len(df_year) == 0:
+        return go.Figure()
 
     # Calculate cumulative data by user
-    cumulative_data = []
-    users = sorted(df_year['user_display'].unique())
-
-    for user in users:
-        user_df = df_year[df_year['user_display'] == user].copy()
-        user_df = user_df.sort_values('merged_at')
-
-        if len(user_df) == 0:
-            continue
-
-        max_day = user_df['day_of_year'].max()
-        for day in range(1, max_day + 1):
-            cumulative_count = user_df[user_df['day_of_year'] <= day]['weight'].sum()
-            cumulative_data.append({
-                'day_of_year': day,
-                'cumulative_prs': cumulative_count,
-                'user': user
-            })
-
-    df_cumulative = pd.DataFrame(cumulative_data)
-
-    if len(df_cumulative) == 0:
-        return go.Figure()
+    users, cumulative, last_day = cumulative_matrix(df_year, 'user_display', weight_column(weight_by))
 
     # Identify top 7 users by final cumulative value
-    n = 7
-    final_values = df_cumulative.groupby('user')['cumulative_prs'].max().sort_values(ascending=False)
-    top_n_users = set(final_values.head(n).index)
-
-    # Create figure with animation
-    fig = go.Figure()
-
-    # Get unique users
-    users = df_cumulative['user'].unique()
-
-    # Generate distinct colors for each user
-    import plotly.express as px
-    color_palette = px.colors.qualitative.Plotly + px.colors.qualitative.Set2 + px.colors.qualitative.Pastel
-    colors = {user: color_palette[i % len(color_palette)] for i, user in enumerate(users)}
-
-    # Add initial traces
-    for user in users:
-        user_color = colors[user]
-        fig.add_trace(go.Scatter(
-            x=[],
-            y=[],
-            mode='lines',
-            name=user,
-            line=dict(color=user_color, width=2),
-            showlegend=True,
-            hovertemplate=f'<b>{user}</b><br>Cumulative PRs: %{{y}}<extra></extra>'
-        ))
-        show_text = user in top_n_users
-        fig.add_trace(go.Scatter(
-            x=[],
-            y=[],
-            mode='markers+text' if show_text else 'markers',
-            name=user,
-            marker=dict(size=10, color=user_color),
-            text=[],
-            textposition='middle right' if show_text else None,
-            textfont=dict(color=user_color, size=10, family='Avenir') if show_text else None,
-            showlegend=False,
-            hovertemplate=f'<b>{user}</b><br>Cumulative PRs: %{{y}}<extra></extra>'
-        ))
-
-    # Create frames
-    frames = []
-    max_day = int(df_cumulative['day_of_year'].max())
-
-    for day in range(1, max_day + 1, 2):
-        frame_data = []
-        for user in users:
-            user_color = colors[user]
-            user_data = df_cumulative[df_cumulative['user'] == user]
-            max_day_for_user = int(user_data['day_of_year'].max())
-
-            user_data_up_to_day = user_data[user_data['day_of_year'] <= day]
-
-            frame_data.append(go.Scatter(
-                x=user_data_up_to_day['day_of_year'],
-                y=user_data_up_to_day['cumulative_prs'],
-                mode='lines',
-                name=user,
-                line=dict(color=user_color, width=2),
-                hovertemplate=f'<b>{user}</b><br>Cumulative PRs: %{{y}}<extra></extra>'
-            ))
-
-            if day <= max_day_for_user:
-                current_point = user_data_up_to_day[user_data_up_to_day['day_of_year'] == day]
-                if len(current_point) == 0:
-                    current_point = user_data_up_to_day.iloc[[-1]] if len(user_data_up_to_day) > 0 else user_data_up_to_day
-            else:
-                current_point = user_data[user_data['day_of_year'] == max_day_for_user]
-
-            if len(current_point) > 0:
-                show_text = user in top_n_users
-                frame_data.append(go.Scatter(
-                    x=current_point['day_of_year'],
-                    y=current_point['cumulative_prs'],
-                    mode='markers+text' if show_text else 'markers',
-                    name=user,
-                    marker=dict(size=10, color=user_color),
-                    text=[user] if show_text else [],
-                    textposition='middle right' if show_text else None,
-                    textfont=dict(color=user_color, size=14, family='Avenir') if show_text else None,
-                    hovertemplate=f'<b>{user}</b><br>Cumulative PRs: %{{y}}<extra></extra>'
-                ))
-            else:
-                frame_data.append(go.Scatter(x=[], y=[], mode='markers', text=[]))
-
-        frames.append(go.Frame(data=frame_data, name=str(day)))
-
-    fig.frames = frames
+    n = min(7, len(users))
+    top_idx = np.argpartition(cumulative[:, -1], -n)[-n:]
+    top_n_users = {users[i] for i in top_idx}
+
+    # Styles are shared by the initial traces and every frame
+    styles = {
+        user: {
+            'line': {'color': USER_COLORS[user], 'width': 2},
+            'marker': {'size': 10, 'color': USER_COLORS[user]},
+            'textfont': {'color': USER_COLORS[user], 'size': 14, 'family': 'Avenir'},
+            'hovertemplate': f'<b>{user}</b><br>Cumulative PRs: %{{y}}<extra></extra>'
+        }
+        for user in users
+    }
+
+    # Add one line trace per user followed by one marker trace per user, with the full curves
+    # Lines are drawn with WebGL; the few labelled markers stay SVG
+    line_traces = []
+    marker_traces = []
+    for u_i, user in enumerate(users):
+        end_day = last_day[u_i]
+        line_traces.append({
+            'type': 'scattergl',
+            'x': DAYS[:end_day],
+            'y': cumulative[u_i, :end_day],
+            'mode': 'lines',
+            'name': user,
+            'line': styles[user]['line'],
+            'showlegend': True,
+            'hovertemplate': styles[user]['hovertemplate']
+        })
+        marker_trace = {
+            'type': 'scatter',
+            'x': DAYS[end_day - 1:end_day],
+            'y': cumulative[u_i, end_day - 1:end_day],
+            'mode': 'markers',
+            'name': user,
+            'marker': styles[user]['marker'],
+            'showlegend': False,
+            'hovertemplate': styles[user]['hovertemplate']
+        }
+        if user in top_n_users:
+            marker_trace.update(
+                mode='markers+text',
+                text=[user],
+                textposition='middle right',
+                textfont=styles[user]['textfont']
+            )
+        marker_traces.append(marker_trace)
+    traces = line_traces + marker_traces
+
+    # Frames are built in the browser from the full curves (assets/animation.js), only their days are sent
+    days = frame_days(cumulative, int(last_day.max()))
 
     weight_label = get_weight_label(weight_by)
-    fig.update_layout(
-        title=f'Cumulative {plot_title_prefix} PRs by User ({year})',
-        xaxis_title='Month',
-        yaxis_title=f'Cumulative {weight_label}',
-        height=600,
-        showlegend=True,
-        font=dict(family='Space Grotesk', size=14),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        xaxis=dict(
-            range=[0, 366],
-            tickmode='array',
-            tickvals=[1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 365],
-            ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Dec'],
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            showline=True,
-            linecolor='#e0e0e0',
-            linewidth=1
-        ),
-        yaxis=dict(
-            range=[0, df_cumulative['cumulative_prs'].max() * 1.1],
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            showline=True,
-            linecolor='#e0e0e0',
-            linewidth=1
-        ),
-        updatemenus=[{
-            'type': 'buttons',
-            'showactive': False,
-            'buttons': [
-                {'label': 'Play', 'method': 'animate', 'args': [None, {
-                    'frame': {'duration': 160, 'redraw': True},
-                    'fromcurrent': True,
-                    'mode': 'immediate'
-                }]},
-                {'label': 'Pause', 'method': 'animate', 'args': [[None], {
-                    'frame': {'duration': 0, 'redraw': False},
-                    'mode': 'immediate'
-                }]}
-            ]
-        }],
-        sliders=[{
-            'steps': [
-                {'args': [[f.name], {'frame': {'duration': 0, 'redraw': True}, 'mode': 'immediate'}],
-                 'label': f'Day {f.name}', 'method': 'animate'}
-                for f in fig.frames[::7]
-            ],
-            'active': 0,
-            'x': 0.1,
-            'len': 0.9,
-            'xanchor': 'left',
-            'y': 0,
-            'yanchor': 'top'
-        }]
-    )
+    layout = {
+        **_BASE_LAYOUT,
+        'title': {'text': f'Cumulative {plot_title_prefix} PRs by User ({year})'},
+        'yaxis': {**_YAXIS_TEMPLATE, 'title': {'text': f'Cumulative {weight_label}'}, 'range': [0, cumulative.max() * 1.1]},
+        'updatemenus': animation_updatemenus(160),
+        'uirevision': str((dataset_selection, year, weight_by)),
+        'sliders': animation_sliders(days),
+        'meta': {'frame_days': days.tolist()}
+    }
+
+    # Create figure, skipping plotly.py validation of every trace
+    fig = go.Figure(dict(data=traces, layout=layout), _validate=False)
 
     return fig
 
 
 def plot_cumulative_reviews_by_user(dataset_selection, year=2025):
     """Create an animated plot showing cumulative reviews throughout the year for each user."""
-    import ast
-    
     # Select dataset
     if not dataset_selection or len(dataset_selection) == 0:
         return go.Figure()
-    
-    # Filter data based on selected sources
-    df = df_all_prs[df_all_prs['source'].isin(dataset_selection)].copy()
-    
-    # Get plot title without 'PRs' suffix
-    title_parts = get_plot_title_prefix(dataset_selection)
-    plot_title_prefix = title_parts.replace(' PRs', '')
-
-    # Preprocess data
-    df['merged_at'] = pd.to_datetime(df['merged_at'])
-    df_merged = df[df['merged_at'].notna()].copy()
-    df_merged['year'] = df_merged['merged_at'].dt.year
-    df_merged['day_of_year'] = df_merged['merged_at'].dt.dayofyear
-    df_merged['date'] = df_merged['merged_at'].dt.date
 
-    # Filter for specified year
-    df_year = df_merged[df_merged['year'] == year].copy()
+    df_year_reviews, plot_title_prefix = select_year(REVIEWS_BY_YEAR, dataset_selection, year)
 
-    if len(df_year) == 0:
+    if df_year_reviews is None or len(df_year_reviews) == 0:
         return go.Figure()
 
-    # Parse requested_reviewers and expand rows
-    review_records = []
-    for _, row in df_year.iterrows():
-        reviewers_str = row['requested_reviewers']
-        if pd.isna(reviewers_str) or reviewers_str == '[]':
-            continue
-        
-        try:
-            reviewers_list = ast.literal_eval(reviewers_str)
-            if isinstance(reviewers_list, list) and len(reviewers_list) > 0:
-                for reviewer_dict in reviewers_list:
-                    if isinstance(reviewer_dict, dict) and 'login' in reviewer_dict:
-                        review_records.append({
-                            'reviewer_login': reviewer_dict['login'],
-                            'merged_at': row['merged_at'],
-                            'day_of_year': row['day_of_year'],
-                            'date': row['date']
-                        })
-        except (ValueError, SyntaxError):
-            continue
-    
-    if len(review_records) == 0:
-        return go.Figure()
-    
-    df_reviews = pd.DataFrame(review_records)
-    
-    # Apply user aliases
-    df_reviews['user_display'] = df_reviews['reviewer_login'].map(user_aliases).fillna(df_reviews['reviewer_login'])
-    
     # Calculate cumulative data by reviewer
-    cumulative_data = []
-    users = sorted(df_reviews['user_display'].unique())
-
-    for user in users:
-        user_df = df_reviews[df_reviews['user_display'] == user].copy()
-        user_df = user_df.sort_values('merged_at')
-
-        if len(user_df) == 0:
-            continue
+    users, cumulative, last_day = cumulative_matrix(df_year_reviews, 'user_display', 'weight')
 
-        max_day = user_df['day_of_year'].max()
-        for day in range(1, max_day + 1):
-            cumulative_count = len(user_df[user_df['day_of_year'] <= day])
-            cumulative_data.append({
-                'day_of_year': day,
-                'cumulative_reviews': cumulative_count,
-                'user': user
-            })
-
-    df_cumulative = pd.DataFrame(cumulative_data)
+    # Identify top 7 users by final cumulative value
+    n = min(7, len(users))
+    top_idx = np.argpartition(cumulative[:, -1], -n)[-n:]
+    top_n_users = {users[i] for i in top_idx}
+
+    # Styles are shared by the initial traces and every frame
+    styles = {
+        user: {
+            'line': {'color': USER_COLORS[user], 'width': 2},
+            'marker': {'size': 10, 'color': USER_COLORS[user]},
+            'textfont': {'color': USER_COLORS[user], 'size': 14, 'family': 'Avenir'},
+            'hovertemplate': f'<b>{user}</b><br>Cumulative Reviews: %{{y}}<extra></extra>'
+        }
+        for user in users
+    }
 
-    if len(df_cumulative) == 0:
-        return go.Figure()
+    # Add one line trace per user followed by one marker trace per user, with the full curves
+    # Lines are drawn with WebGL; the few labelled markers stay SVG
+    line_traces = []
+    marker_traces = []
+    for u_i, user in enumerate(users):
+        end_day = last_day[u_i]
+        line_traces.append({
+            'type': 'scattergl',
+            'x': DAYS[:end_day],
+            'y': cumulative[u_i, :end_day],
+            'mode': 'lines',
+            'name': user,
+            'line': styles[user]['line'],
+            'showlegend': True,
+            'hovertemplate': styles[user]['hovertemplate']
+        })
+        marker_trace = {
+            'type': 'scatter',
+            'x': DAYS[end_day - 1:end_day],
+            'y': cumulative[u_i, end_day - 1:end_day],
+            'mode': 'markers',
+            'name': user,
+            'marker': styles[user]['marker'],
+            'showlegend': False,
+            'hovertemplate': styles[user]['hovertemplate']
+        }
+        if user in top_n_users:
+            marker_trace.update(
+                mode='markers+text',
+                text=[user],
+                textposition='middle right',
+                textfont=styles[user]['textfont']
+            )
+        marker_traces.append(marker_trace)
+    traces = line_traces + marker_traces
+
+    # Frames are built in the browser from the full curves (assets/animation.js), only their days are sent
+    days = frame_days(cumulative, int(last_day.max()))
+
+    layout = {
+        **_BASE_LAYOUT,
+        'title': {'text': f'Cumulative {plot_title_prefix} Reviews by User ({year})'},
+        'yaxis': {**_YAXIS_TEMPLATE, 'title': {'text': 'Cumulative Reviews'}, 'range': [0, cumulative.max() * 1.1]},
+        'updatemenus': animation_updatemenus(160),
+        'uirevision': str((dataset_selection, year)),
+        'sliders': animation_sliders(days),
+        'meta': {'frame_days': days.tolist()}
+    }
 
-    # Identify top 7 users by final cumulative value
-    n = 7
-    final_values = df_cumulative.groupby('user')['cumulative_reviews'].max().sort_values(ascending=False)
-    top_n_users = set(final_values.head(n).index)
-
-    # Create figure with animation
-    fig = go.Figure()
-
-    # Get unique users
-    users = df_cumulative['user'].unique()
-
-    # Generate distinct colors for each user
-    import plotly.express as px
-    color_palette = px.colors.qualitative.Plotly + px.colors.qualitative.Set2 + px.colors.qualitative.Pastel
-    colors = {user: color_palette[i % len(color_palette)] for i, user in enumerate(users)}
-
-    # Add initial traces
-    for user in users:
-        user_color = colors[user]
-        fig.add_trace(go.Scatter(
-            x=[],
-            y=[],
-            mode='lines',
-            name=user,
-            line=dict(color=user_color, width=2),
-            showlegend=True,
-            hovertemplate=f'<b>{user}</b><br>Cumulative Reviews: %{{y}}<extra></extra>'
-        ))
-        show_text = user in top_n_users
-        fig.add_trace(go.Scatter(
-            x=[],
-            y=[],
-            mode='markers+text' if show_text else 'markers',
-            name=user,
-            marker=dict(size=10, color=user_color),
-            text=[],
-            textposition='middle right' if show_text else None,
-            textfont=dict(color=user_color, size=10, family='Avenir') if show_text else None,
-            showlegend=False,
-            hovertemplate=f'<b>{user}</b><br>Cumulative Reviews: %{{y}}<extra></extra>'
-        ))
-
-    # Create frames
-    frames = []
-    max_day = int(df_cumulative['day_of_year'].max())
-
-    for day in range(1, max_day + 1, 2):
-        frame_data = []
-        for user in users:
-            user_color = colors[user]
-            user_data = df_cumulative[df_cumulative['user'] == user]
-            max_day_for_user = int(user_data['day_of_year'].max())
-
-            user_data_up_to_day = user_data[user_data['day_of_year'] <= day]
-
-            frame_data.append(go.Scatter(
-                x=user_data_up_to_day['day_of_year'],
-                y=user_data_up_to_day['cumulative_reviews'],
-                mode='lines',
-                name=user,
-                line=dict(color=user_color, width=2),
-                hovertemplate=f'<b>{user}</b><br>Cumulative Reviews: %{{y}}<extra></extra>'
-            ))
-
-            if day <= max_day_for_user:
-                current_point = user_data_up_to_day[user_data_up_to_day['day_of_year'] == day]
-                if len(current_point) == 0:
-                    current_point = user_data_up_to_day.iloc[[-1]] if len(user_data_up_to_day) > 0 else user_data_up_to_day
-            else:
-                current_point = user_data[user_data['day_of_year'] == max_day_for_user]
-
-            if len(current_point) > 0:
-                show_text = user in top_n_users
-                frame_data.append(go.Scatter(
-                    x=current_point['day_of_year'],
-                    y=current_point['cumulative_reviews'],
-                    mode='markers+text' if show_text else 'markers',
-                    name=user,
-                    marker=dict(size=10, color=user_color),
-                    text=[user] if show_text else [],
-                    textposition='middle right' if show_text else None,
-                    textfont=dict(color=user_color, size=14, family='Avenir') if show_text else None,
-                    hovertemplate=f'<b>{user}</b><br>Cumulative Reviews: %{{y}}<extra></extra>'
-                ))
-            else:
-                frame_data.append(go.Scatter(x=[], y=[], mode='markers', text=[]))
-
-        frames.append(go.Frame(data=frame_data, name=str(day)))
-
-    fig.frames = frames
-
-    fig.update_layout(
-        title=f'Cumulative {plot_title_prefix} Reviews by User ({year})',
-        xaxis_title='Month',
-        yaxis_title='Cumulative Reviews',
-        height=600,
-        showlegend=True,
-        font=dict(family='Space Grotesk', size=14),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        xaxis=dict(
-            range=[0, 366],
-            tickmode='array',
-            tickvals=[1, 32, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 365],
-            ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Dec'],
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            showline=True,
-            linecolor='#e0e0e0',
-            linewidth=1
-        ),
-        yaxis=dict(
-            range=[0, df_cumulative['cumulative_reviews'].max() * 1.1],
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            showline=True,
-            linecolor='#e0e0e0',
-            linewidth=1
-        ),
-        updatemenus=[{
-            'type': 'buttons',
-            'showactive': False,
-            'buttons': [
-                {'label': 'Play', 'method': 'animate', 'args': [None, {
-                    'frame': {'duration': 160, 'redraw': True},
-                    'fromcurrent': True,
-                    'mode': 'immediate'
-                }]},
-                {'label': 'Pause', 'method': 'animate', 'args': [[None], {
-                    'frame': {'duration': 0, 'redraw': False},
-                    'mode': 'immediate'
-                }]}
-            ]
-        }],
-        sliders=[{
-            'steps': [
-                {'args': [[f.name], {'frame': {'duration': 0, 'redraw': True}, 'mode': 'immediate'}],
-                 'label': f'Day {f.name}', 'method': 'animate'}
-                for f in fig.frames[::7]
-            ],
-            'active': 0,
-            'x': 0.1,
-            'len': 0.9,
-            'xanchor': 'left',
-            'y': 0,
-            'yanchor': 'top'
-        }]
-    )
+    # Create figure, skipping plotly.py validation of every trace
+    fig = go.Figure(dict(data=traces, layout=layout), _validate=False)
 
     return fig
 
 
-# Initialize the Dash app
-external_stylesheets = ['https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap']
-app = Dash(__name__, external_stylesheets=external_stylesheets)
-
 app.layout = html.Div([
     html.H1("PR Visualisations Dashboard", style={'textAlign': 'center', 'fontFamily': 'Space Grotesk'}),
 
     html.Div([
         html.Div([
             html.Label("Select Dataset:", style={'fontWeight': 'bold', 'fontFamily': 'Avenir', 'marginBottom': '10px', 'display': 'block'}),
-            html.Div([
-                dcc.Checklist(
-                    id='dataset-mapper',
-                    options=[{'label': ' Mapper Template PRs', 'value': 'mapper_template'}],
-                    value=['mapper_template'],
-                    style={'display': 'inline-block', 'marginRight': '20px', 'fontFamily': 'Avenir'}
-                ),
-                dcc.Checklist(
-                    id='dataset-space',
-                    options=[{'label': ' Space Intelligence PRs', 'value': 'space_intelligence'}],
-                    value=['space_intelligence'],
-                    style={'display': 'inline-block', 'marginRight': '20px', 'fontFamily': 'Avenir'}
-                ),
-                dcc.Checklist(
-                    id='dataset-qgis',
-                    options=[{'label': ' QGIS Plugin PRs', 'value': 'qgis_plugins'}],
-                    value=['qgis_plugins'],
-                    style={'display': 'inline-block', 'fontFamily': 'Avenir'}
-                ),
-            ]),
+            dcc.Checklist(
+                id='datasets',
+                options=[
+                    {'label': ' Mapper Template PRs', 'value': 'mapper_template'},
+                    {'label': ' Space Intelligence PRs', 'value': 'space_intelligence'},
+                    {'label': ' QGIS Plugin PRs', 'value': 'qgis_plugins'}
+                ],
+                value=['mapper_template', 'space_intelligence', 'qgis_plugins'],
+                inline=True,
+                labelStyle={'marginRight': '20px', 'fontFamily': 'Avenir'}
+            ),
         ], style={'display': 'inline-block', 'marginRight': '40px', 'fontFamily': 'Avenir', 'verticalAlign': 'top'}),
 
         html.Div([
@@ -779,6 +638,13 @@ app.layout = html.Div([
         ], style={'display': 'inline-block', 'fontFamily': 'Avenir'}),
     ], style={'margin': '20px', 'fontFamily': 'Avenir'}),
 
+    # Dataset selection shared by the graph callbacks
+    dcc.Store(id='dataset-selection', data=SOURCES),
+    # Figures without animation frames, which are added in the browser
+    dcc.Store(id='year-comparison-figure'),
+    dcc.Store(id='user-comparison-figure'),
+    dcc.Store(id='reviews-comparison-figure'),
+
     html.Div([
         dcc.Graph(id='year-comparison-graph'),
     ]),
@@ -793,67 +659,74 @@ app.layout = html.Div([
 ], style={'fontFamily': 'Avenir'})
 
 
+# Serialised figures, keyed by (plot function, dataset selection, plot arguments)
+@lru_cache(maxsize=64)
+def cached_figure_json(plot_function, dataset_selection, kwargs_items):
+    """Build a figure and keep its plotly JSON, evicting the least recently used beyond 64 entries."""
+    return plot_function(dataset_selection, **dict(kwargs_items)).to_plotly_json()
+
+
+def get_figure_json(plot_function, dataset_selection, **kwargs):
+    """Get the plotly JSON of a figure, building and caching it on first request."""
+    # The selection store keeps the sources in a fixed order, so the tuple is a stable cache key
+    return cached_figure_json(plot_function, tuple(dataset_selection), tuple(sorted(kwargs.items())))
+
+
 @callback(
-    Output('year-comparison-graph', 'figure'),
-    Input('dataset-mapper', 'value'),
-    Input('dataset-space', 'value'),
-    Input('dataset-qgis', 'value'),
+    Output('dataset-selection', 'data'),
+    Input('datasets', 'value'),
+    State('dataset-selection', 'data'),
+    prevent_initial_call=True
+)
+def update_dataset_selection(datasets, current_selection):
+    """Share the checked datasets with all graphs, in a fixed order regardless of click order."""
+    dataset_selection = [source for source in SOURCES if source in (datasets or [])]
+    # Leave the graphs alone when the selection did not actually change
+    if dataset_selection == current_selection:
+        raise PreventUpdate
+    return dataset_selection
+
+
+@callback(
+    Output('year-comparison-figure', 'data'),
+    Input('dataset-selection', 'data'),
     Input('weight-dropdown', 'value')
 )
-def update_year_graph(mapper_checked, space_checked, qgis_checked, weight_by):
+def update_year_graph(dataset_selection, weight_by):
     """Update the year comparison graph based on dataset and weight selection."""
-    # Combine all checked datasets
-    dataset_selection = []
-    if mapper_checked:
-        dataset_selection.extend(mapper_checked)
-    if space_checked:
-        dataset_selection.extend(space_checked)
-    if qgis_checked:
-        dataset_selection.extend(qgis_checked)
-    return plot_cumulative_prs(dataset_selection, weight_by)
+    return get_figure_json(plot_cumulative_prs, dataset_selection, weight_by=weight_by)
 
 
 @callback(
-    Output('user-comparison-graph', 'figure'),
-    Input('dataset-mapper', 'value'),
-    Input('dataset-space', 'value'),
-    Input('dataset-qgis', 'value'),
+    Output('user-comparison-figure', 'data'),
+    Input('dataset-selection', 'data'),
     Input('weight-dropdown', 'value')
 )
-def update_user_graph(mapper_checked, space_checked, qgis_checked, weight_by):
+def update_user_graph(dataset_selection, weight_by):
     """Update the user comparison graph based on dataset and weight selection."""
-    # Combine all checked datasets
-    dataset_selection = []
-    if mapper_checked:
-        dataset_selection.extend(mapper_checked)
-    if space_checked:
-        dataset_selection.extend(space_checked)
-    if qgis_checked:
-        dataset_selection.extend(qgis_checked)
-    return plot_cumulative_prs_by_user(dataset_selection, year=2025, weight_by=weight_by)
+    return get_figure_json(plot_cumulative_prs_by_user, dataset_selection, year=2025, weight_by=weight_by)
 
 
 @callback(
-    Output('reviews-comparison-graph', 'figure'),
-    Input('dataset-mapper', 'value'),
-    Input('dataset-space', 'value'),
-    Input('dataset-qgis', 'value')
+    Output('reviews-comparison-figure', 'data'),
+    Input('dataset-selection', 'data')
 )
-def update_reviews_graph(mapper_checked, space_checked, qgis_checked):
+def update_reviews_graph(dataset_selection):
     """Update the reviews comparison graph based on dataset selection."""
-    # Combine all checked datasets
-    dataset_selection = []
-    if mapper_checked:
-        dataset_selection.extend(mapper_checked)
-    if space_checked:
-        dataset_selection.extend(space_checked)
-    if qgis_checked:
-        dataset_selection.extend(qgis_checked)
-    return plot_cumulative_reviews_by_user(dataset_selection, year=2025)
+    return get_figure_json(plot_cumulative_reviews_by_user, dataset_selection, year=2025)
+
+
+# Build the animation frames in the browser from each figure's curves and frame days
+for _graph in ['year-comparison', 'user-comparison', 'reviews-comparison']:
+    clientside_callback(
+        ClientsideFunction(namespace='animation', function_name='add_frames'),
+        Output(f'{_graph}-graph', 'figure'),
+        Input(f'{_graph}-figure', 'data')
+    )
 
 
 if __name__ == '__main__':
     import os
     port = int(os.environ.get('PORT', 8050))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=False)
 
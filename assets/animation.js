@@ -0,0 +1,44 @@
+// Build the animation frames of the PR figures in the browser, so the server only sends the full curves
+
+// Decode the base64 typed arrays plotly.py sends for numpy data
+const TYPED_ARRAYS = {
+    i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array,
+    i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array
+};
+
+function decode(values) {
+    if (values && values.bdata !== undefined) {
+        const binary = atob(values.bdata);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new TYPED_ARRAYS[values.dtype](bytes.buffer);
+    }
+    return values;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    animation: {
+        // The figure holds one line trace per curve followed by one marker trace per curve,
+        // and layout.meta.frame_days lists the days to animate
+        add_frames: function(figure) {
+            if (!figure || !figure.layout || !figure.layout.meta) {
+                return figure;
+            }
+            const nCurves = figure.data.length / 2;
+            const curves = figure.data.slice(0, nCurves).map(trace => ({x: decode(trace.x), y: decode(trace.y)}));
+            const traces = figure.data.map((trace, i) => i);
+            const frames = figure.layout.meta.frame_days.map(day => {
+                // Curves stop at their last active day
+                const lines = curves.map(curve => {
+                    const end = Math.min(day, curve.x.length);
+                    return {x: curve.x.slice(0, end), y: curve.y.slice(0, end)};
+                });
+                const markers = lines.map(line => ({x: line.x.slice(-1), y: line.y.slice(-1)}));
+                return {name: String(day), data: lines.concat(markers), traces: traces};
+            });
+            return Object.assign({}, figure, {frames: frames});
+        }
+    }
+});
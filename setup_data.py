@@ -0,0 +1,50 @@
+"""Convert the PR data CSV to Parquet for the dashboard."""
+
+import pathlib
+
+import pandas as pd
+
+DATA_DIR = pathlib.Path("data")
+CSV_PATH = DATA_DIR / "all_prs_detailed_qgis.csv"
+PARQUET_PATH = DATA_DIR / "all_prs_detailed_qgis.parquet"
+
+# Only the columns used by the dashboard, with explicit types
+USECOLS = [
+    "user.login",
+    "additions",
+    "deletions",
+    "review_comment_count",
+    "merged_at",
+    "base.repo.name",
+    "requested_reviewers",
+]
+DTYPES = {
+    "additions": "Int32",
+    "deletions": "Int32",
+    "review_comment_count": "Int32",
+    "user.login": "category",
+    "base.repo.name": "category",
+}
+
+
+def parquet_is_stale():
+    """Check whether the Parquet copy is missing or older than the CSV."""
+    if not CSV_PATH.exists():
+        return False
+    return not PARQUET_PATH.exists() or PARQUET_PATH.stat().st_mtime < CSV_PATH.stat().st_mtime
+
+
+def convert_csv_to_parquet():
+    """Read the CSV with the PyArrow engine and write the typed columns to Parquet."""
+    df = pd.read_csv(CSV_PATH, engine="pyarrow", usecols=USECOLS, dtype=DTYPES, parse_dates=["merged_at"])
+    df.to_parquet(PARQUET_PATH)
+
+
+def main():
+    """Convert the PR data CSV to Parquet."""
+    convert_csv_to_parquet()
+    print(f"Wrote {PARQUET_PATH}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 import os
 import pathlib
+import re
 
 import rich.prompt
 
@@ -12,42 +13,40 @@ def guess_project_name():
     return current_path.split("/")[-1]
 
 
+def read_script(path):
+    """Read a conda activation script, creating its directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.read_text() if path.exists() else ""
+
+
+def append_line(text, line):
+    """Append a line to a script, starting it on a new line."""
+    if text and not text.endswith("\n"):
+        text += "\n"
+    return f"{text}{line}\n"
+
+
 def set_root_dir_env_var():
     """Set the SI_ROOT_DIR environment variable in the conda environment.
 
     Implements https://conda.io/projects/conda/en/latest/user-guide/tasks/manage-environments.html#macos-and-linux
     for persistent env vars.
     """
-    activate_script = os.path.join(os.environ["CONDA_PREFIX"], "etc/conda/activate.d", "env_var.sh")
-    deactivate_script = os.path.join(os.environ["CONDA_PREFIX"], "etc/conda/deactivate.d", "env_var.sh")
+    activate_script = pathlib.Path(os.environ["CONDA_PREFIX"], "etc/conda/activate.d", "env_var.sh")
+    deactivate_script = pathlib.Path(os.environ["CONDA_PREFIX"], "etc/conda/deactivate.d", "env_var.sh")
     root_dir = os.getcwd()
+    export_line = f"export SI_ROOT_DIR={root_dir}"
+
+    # Replace any existing export of SI_ROOT_DIR, or append one
+    text = read_script(activate_script)
+    text, replaced = re.subn(r"^export SI_ROOT_DIR=.*$", lambda _: export_line, text, flags=re.MULTILINE)
+    if not replaced:
+        text = append_line(text, export_line)
+    activate_script.write_text(text)
 
-    pathlib.Path(activate_script).touch()
-    with open(activate_script) as file:
-        file_data = file.readlines()
-    overwrite = False
-    for lineno, line in enumerate(file_data):
-        if "export SI_ROOT_DIR=" in line:
-            overwrite = True
-            break
-        if overwrite:
-            file_data[lineno] = f"export SI_ROOT_DIR={root_dir}"
-        else:
-            file_data.append(f"export SI_ROOT_DIR={root_dir}")
-    with open(activate_script, "w") as file:
-        file.writelines(file_data)
-
-    pathlib.Path(deactivate_script).touch()
-    with open(deactivate_script) as file:
-        file_data = file.readlines()
-    done = False
-    for line in file_data:
-        if "unset SI_ROOT_DIR" in line:
-            done = True
-    if not done:
-        file_data.append("unset SI_ROOT_DIR")
-    with open(deactivate_script, "w") as file:
-        file.writelines(file_data)
+    text = read_script(deactivate_script)
+    if not re.search(r"^unset SI_ROOT_DIR$", text, flags=re.MULTILINE):
+        deactivate_script.write_text(append_line(text, "unset SI_ROOT_DIR"))
     print("Set the SI_ROOT_DIR environment variable. Re-activate your conda environment when this script finishes.")
     os.environ["SI_ROOT_DIR"] = root_dir
 